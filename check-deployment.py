@@ -5,37 +5,51 @@ Checks health endpoints and provides deployment information.
 """
 
 import requests
-import json
+import orjson
 import sys
-from datetime import datetime
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+from requests.adapters import HTTPAdapter
 
-def check_endpoint(url: str, endpoint: str = "") -> Dict[str, Any]:
+# Shared session so all probes against the deployment reuse keep-alive connections
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=16))
+SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=16))
+
+def iso_now() -> str:
+    """Return the current UTC time as an ISO 8601 string with second granularity."""
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+def check_endpoint(url: str, endpoint: str = "", session: requests.Session = SESSION) -> Dict[str, Any]:
     """Check a specific endpoint and return status information."""
     full_url = f"{url.rstrip('/')}/{endpoint.lstrip('/')}"
     
     try:
-        response = requests.get(full_url, timeout=10)
+        # A single GET: the app's routes do not answer HEAD, so probing with HEAD
+        # first would cost a 405 round trip on every endpoint
+        response = session.get(full_url, timeout=10)
         return {
             "url": full_url,
             "status_code": response.status_code,
             "response_time": response.elapsed.total_seconds(),
             "success": response.status_code == 200,
             "content_type": response.headers.get("content-type", ""),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": iso_now()
         }
     except requests.exceptions.RequestException as e:
         return {
             "url": full_url,
             "error": str(e),
             "success": False,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": iso_now()
         }
 
-def check_health_endpoint(url: str) -> Dict[str, Any]:
+def check_health_endpoint(url: str, session: requests.Session = SESSION) -> Dict[str, Any]:
     """Check the health endpoint and return detailed health information."""
     try:
-        response = requests.get(f"{url.rstrip('/')}/api/health", timeout=10)
+        response = session.get(f"{url.rstrip('/')}/api/health", timeout=10)
         if response.status_code == 200:
             health_data = response.json()
             return {
@@ -43,54 +57,66 @@ def check_health_endpoint(url: str) -> Dict[str, Any]:
                 "status": "healthy",
                 "data": health_data,
                 "response_time": response.elapsed.total_seconds(),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": iso_now()
             }
         else:
             return {
                 "url": f"{url}/api/health",
                 "status": "unhealthy",
                 "status_code": response.status_code,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": iso_now()
             }
     except requests.exceptions.RequestException as e:
         return {
             "url": f"{url}/api/health",
             "status": "error",
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": iso_now()
         }
 
-def check_api_endpoints(url: str) -> Dict[str, Any]:
-    """Check various API endpoints for functionality."""
-    endpoints = [
-        "api/etfs",
-        "api/strategy/parameters",
-        "",  # Root endpoint
-    ]
+API_ENDPOINTS = [
+    "api/etfs",
+    "api/strategy/parameters",
+    "",  # Root endpoint
+]
+
+def check_api_endpoints(url: str, executor: Optional[ThreadPoolExecutor] = None) -> Dict[str, Any]:
+    """Check various API endpoints for functionality.
+
+    Endpoints are probed concurrently; pass an existing executor to share
+    its workers with other checks.
+    """
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=len(API_ENDPOINTS)) as own_executor:
+            return check_api_endpoints(url, own_executor)
     
-    results = {}
-    for endpoint in endpoints:
-        results[endpoint or "root"] = check_endpoint(url, endpoint)
+    futures = {executor.submit(check_endpoint, url, endpoint): index for index, endpoint in enumerate(API_ENDPOINTS)}
     
-    return results
+    # Results are slotted by endpoint index, so the report order is stable regardless of completion order
+    results: List[Optional[Dict[str, Any]]] = [None] * len(API_ENDPOINTS)
+    for future in as_completed(futures):
+        results[futures[future]] = future.result()
+    
+    return {endpoint or "root": result for endpoint, result in zip(API_ENDPOINTS, results)}
 
 def generate_deployment_report(url: str) -> Dict[str, Any]:
     """Generate a comprehensive deployment report."""
     print(f"🔍 Checking deployment at: {url}")
     print("=" * 50)
     
-    # Check health
-    print("🏥 Checking health endpoint...")
-    health_status = check_health_endpoint(url)
-    
-    # Check API endpoints
-    print("🔌 Checking API endpoints...")
-    api_status = check_api_endpoints(url)
+    # Health and API endpoints are checked concurrently in a shared pool
+    with ThreadPoolExecutor(max_workers=len(API_ENDPOINTS) + 1) as executor:
+        print("🏥 Checking health endpoint...")
+        health_future = executor.submit(check_health_endpoint, url)
+        
+        print("🔌 Checking API endpoints...")
+        api_status = check_api_endpoints(url, executor)
+        health_status = health_future.result()
     
     # Generate report
     report = {
         "deployment_url": url,
-        "check_timestamp": datetime.now().isoformat(),
+        "check_timestamp": iso_now(),
         "health_status": health_status,
         "api_endpoints": api_status,
         "overall_status": "healthy" if health_status.get("status") == "healthy" else "unhealthy"
@@ -146,8 +172,7 @@ def main():
         
         # Save report to file
         filename = f"deployment-report-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
-        with open(filename, 'w') as f:
-            json.dump(report, f, indent=2)
+        Path(filename).write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC))
         print(f"\n💾 Report saved to: {filename}")
         
         # Exit with appropriate code
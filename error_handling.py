@@ -1,12 +1,19 @@
 import logging
+import re
+from datetime import date, datetime
+from functools import lru_cache
 from typing import Any, Dict, Optional, Union
 from fastapi import HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 logger = logging.getLogger(__name__)
 
+# Precompiled validation patterns
+_TICKER_RE = re.compile(r'^[A-Za-z0-9.]+$')
+_DATE_RE = re.compile(r'([0-9]{4})-([0-9]{2})-([0-9]{2})')
+
 class GemStrategyError(Exception):
     """Base exception for GemStrategy application."""
     
@@ -96,29 +103,37 @@ def safe_float_conversion(value: Any, default: float = 0.0) -> float:
         logger.warning(f"Failed to convert {value} to float: {str(e)}")
         return default
 
+@lru_cache(maxsize=256)
 def validate_date_string(date_str: str) -> bool:
     """Validate date string format."""
+    match = _DATE_RE.fullmatch(date_str) if isinstance(date_str, str) else None
+    if match:
+        # Fast path for the canonical YYYY-MM-DD form: only the calendar range needs checking
+        try:
+            date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+            return True
+        except ValueError:
+            return False
     try:
-        from datetime import datetime
         datetime.strptime(date_str, '%Y-%m-%d')
         return True
-    except ValueError:
+    except (ValueError, TypeError):
         return False
 
+@lru_cache(maxsize=256)
 def validate_ticker(ticker: str) -> bool:
     """Validate ticker format."""
     if not ticker or not isinstance(ticker, str):
         return False
     # Basic validation - ticker should be alphanumeric with possible dots
-    import re
-    return bool(re.match(r'^[A-Za-z0-9.]+$', ticker))
+    return bool(_TICKER_RE.match(ticker))
 
 def log_and_raise_error(error: Exception, context: str = None, **kwargs):
     """Log error and raise it with additional context."""
     logger.error(f"Error in {context or 'unknown context'}: {str(error)}", exc_info=True, extra=kwargs)
     raise error
 
-def create_error_response(error: Exception, status_code: int = 500) -> JSONResponse:
+def create_error_response(error: Exception, status_code: int = 500) -> ORJSONResponse:
     """Create standardized error response."""
     if isinstance(error, GemStrategyError):
         error_data = error.to_dict()
@@ -132,24 +147,24 @@ def create_error_response(error: Exception, status_code: int = 500) -> JSONRespo
     
     logger.error(f"Returning error response: {error_data}")
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code,
         content=error_data
     )
 
 # FastAPI exception handlers
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: HTTPException) -> ORJSONResponse:
     """Handle HTTP exceptions."""
     logger.warning(f"HTTP exception: {exc.status_code} - {exc.detail}")
     return create_error_response(exc, exc.status_code)
 
-async def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
+async def validation_exception_handler(request: Request, exc: RequestValidationError) -> ORJSONResponse:
     """Handle validation exceptions."""
     logger.warning(f"Validation error: {exc.errors()}")
     error = ValidationError("Request validation failed", details={"validation_errors": exc.errors()})
     return create_error_response(error, 422)
 
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def general_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """Handle general exceptions."""
     logger.error(f"Unhandled exception: {str(exc)}", exc_info=True)
     return create_error_response(exc, 500)
@@ -1,8 +1,31 @@
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
+
+# Background listener that performs file writes off the request thread
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+class _CachingFormatter(logging.Formatter):
+    """
+    Formatter that formats each record only once.
+    
+    The file and error handlers share one instance, and RotatingFileHandler
+    formats a record both to check for rollover and to write it, so caching
+    the result on the record avoids repeating that work per handler.
+    """
+    
+    def format(self, record: logging.LogRecord) -> str:
+        cached = getattr(record, '_cached_format', None)
+        if cached is not None and cached[0] is self:
+            return cached[1]
+        formatted = super().format(record)
+        record._cached_format = (self, formatted)
+        return formatted
 
 def setup_logging(
     log_level: str = "INFO",
@@ -29,9 +52,10 @@ def setup_logging(
     
     # Clear any existing handlers
     root_logger.handlers.clear()
+    _stop_queue_listener()
     
     # Create formatters
-    detailed_formatter = logging.Formatter(
+    detailed_formatter = _CachingFormatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
     )
     
@@ -65,10 +89,17 @@ def setup_logging(
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(detailed_formatter)
     
+    # File handlers run on a background QueueListener so log calls never block on disk I/O
+    global _queue_listener
+    log_queue: queue.Queue = queue.Queue(-1)
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, error_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
+    
     # Add handlers to root logger
     root_logger.addHandler(console_handler)
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(error_handler)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
     
     # Set specific logger levels
     logging.getLogger('uvicorn').setLevel(logging.WARNING)
@@ -82,6 +113,15 @@ def setup_logging(
     logger.info(f"Log file: {log_file}")
     logger.info(f"Error log file: {error_log_file}")
 
+def _stop_queue_listener() -> None:
+    """Flush pending records and stop the background file-logging listener."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+atexit.register(_stop_queue_listener)
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance with the specified name.
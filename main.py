@@ -1,28 +1,38 @@
 from fastapi import FastAPI, Request, Form
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
-import pandas as pd
-from datetime import datetime, timedelta
-from functools import lru_cache
-from io import StringIO
-from curl_cffi import requests as cffi_requests
+import asyncio
+import hashlib
+import orjson
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from dateutil.relativedelta import relativedelta
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from requests.exceptions import RequestException
 
 from logging_config import configure_logging_from_env, get_logger
 from error_handling import (
     DataFetchError, DataProcessingError, StrategyCalculationError,
     ValidationError, handle_data_fetch_error, handle_data_processing_error,
-    safe_divide, safe_float_conversion, validate_date_string, validate_ticker,
+    validate_date_string, validate_ticker,
     register_exception_handlers
 )
 from services.strategy_service import StrategyService
-from services.data_service import DataService
+from services.data_service import DataService, HistoricalSeries
 from config_package.settings import get_settings
-import json
-from typing import Dict, List, Optional, Tuple, Any, Union
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple, Any, Union, TYPE_CHECKING
 from logging import Logger
 
+# pandas, numpy and curl_cffi are imported lazily on the data path so that
+# cold starts serving only the lightweight endpoints do not pay for them
+if TYPE_CHECKING:
+    import pandas as pd
+    from curl_cffi.requests import AsyncSession
+
 # Configure logging
 configure_logging_from_env()
 logger = get_logger(__name__)
@@ -35,6 +45,7 @@ app = FastAPI(
     description=settings.api.description,
     version=settings.api.version,
     debug=settings.api.debug,
+    default_response_class=ORJSONResponse,
     docs_url="/docs" if settings.api.debug else None,
     redoc_url="/redoc" if settings.api.debug else None,
     openapi_tags=[
@@ -64,59 +75,260 @@ logger.info(f"Environment: {settings.environment}")
 logger.info(f"Debug mode: {settings.api.debug}")
 logger.info(f"API version: {settings.api.version}")
 
+@cache
+def _get_parse_executor() -> ThreadPoolExecutor:
+    """Shared worker pool for CSV parsing, so pandas work never blocks the event loop."""
+    return ThreadPoolExecutor(max_workers=8, thread_name_prefix="stooq-parse")
+
+# Columns of the Stooq daily CSV needed to compute returns
+STOOQ_CSV_COLUMNS = frozenset({"Data", "Close", "Zamkniecie"})
+
+@cache
+def _get_pyarrow_csv() -> Optional[Tuple[Any, Any, Dict[str, Any]]]:
+    """
+    Return (pyarrow.csv, BufferReader, column types) or None if pyarrow is not installed.
+    
+    Resolved once: a failed import is not cached in sys.modules, so retrying it
+    on every parse would repeat the whole module search. Column types are pinned
+    so pyarrow does not infer them block by block on large files.
+    """
+    try:
+        import pyarrow as pa
+        from pyarrow import csv
+    except ImportError:
+        return None
+    column_types = {"Data": pa.date32(), "Close": pa.float64(), "Zamkniecie": pa.float64()}
+    return csv, pa.BufferReader, column_types
+
+def _read_stooq_csv(csv_data: bytes) -> "pd.DataFrame":
+    """
+    Parse a Stooq daily CSV, keeping only the date and close columns.
+    
+    Uses pyarrow's CSV reader straight from the response bytes when pyarrow is
+    installed, and falls back to pandas' parser otherwise.
+    """
+    import pandas as pd
+    
+    pyarrow_csv = _get_pyarrow_csv()
+    if pyarrow_csv is None:
+        from io import BytesIO
+        return pd.read_csv(BytesIO(csv_data), usecols=lambda col: col in STOOQ_CSV_COLUMNS)
+    
+    pa_csv, BufferReader, column_types = pyarrow_csv
+    # utf-8-sig strips a leading byte-order mark; the decoded names are handed to
+    # pyarrow so the date column is "Data" rather than "\ufeffData"
+    header = csv_data.split(b"\n", 1)[0].decode("utf-8-sig", errors="replace").strip().split(",")
+    columns = [col for col in header if col in STOOQ_CSV_COLUMNS]
+    if not columns:
+        return pd.DataFrame()
+    
+    table = pa_csv.read_csv(
+        BufferReader(csv_data),
+        read_options=pa_csv.ReadOptions(column_names=header, skip_rows=1),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=columns,
+            column_types={col: column_types[col] for col in columns}
+        )
+    )
+    return table.to_pandas(date_as_object=False, self_destruct=True)
+
 class StooqDataFetcher:
     """Klasa odpowiedzialna za pobieranie i cachowanie danych z serwisu Stooq."""
     
-    def __init__(self, cache_ttl_hours: int = 4) -> None:
+    CACHE_MAXSIZE: int = 32
+    # Bump when the cached result layout changes so stale cache files are ignored
+    DISK_CACHE_VERSION: int = 6
+    # Results whose 12-month window ended at least this long ago are treated as immutable
+    IMMUTABLE_AFTER: timedelta = timedelta(days=7)
+    # Cap on cached files; reference dates come from user input and immutable entries never
+    # expire, so without it the cache (memory-backed /tmp on Cloud Run/App Engine) grows unbounded
+    DISK_CACHE_MAX_FILES: int = 512
+    
+    def __init__(self, cache_ttl_hours: int = 4, cache_dir: Optional[str] = None) -> None:
         self.CACHE_TTL: timedelta = timedelta(hours=cache_ttl_hours)
         self.last_cache_reset: datetime = datetime.now()
         self.logger: Logger = get_logger(__name__)
-        self.logger.info(f"StooqDataFetcher initialized with cache TTL: {cache_ttl_hours} hours")
+        self._cache: Dict[Tuple[str, str], Tuple[Optional[float], Optional[datetime.date], Optional[datetime.date], Optional[HistoricalSeries]]] = {}
+        # One session for all Stooq requests so TLS sessions and connections are reused
+        self._session: Optional["AsyncSession"] = None
+        # Latest (ETag, Last-Modified) per ticker, used for conditional requests
+        self._validators: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        self.cache_dir: Optional[Path] = self._prepare_cache_dir(Path(cache_dir)) if cache_dir else None
+        self.logger.info(f"StooqDataFetcher initialized with cache TTL: {cache_ttl_hours} hours, disk cache: {self.cache_dir}")
 
-    @lru_cache(maxsize=32)
-    def _get_12m_return_stooq_cached(self, ticker: str, reference_date_str: str) -> Tuple[Optional[float], Optional[datetime.date], Optional[datetime.date], Optional[List[Dict[str, Any]]]]:
+    def _prepare_cache_dir(self, cache_dir: Path) -> Optional[Path]:
         """
-        Pobiera dane dzienne z Stooq i liczy zwrot % za okres 1 roku.
-        Wyniki są cachowane w pamięci, aby unikać wielokrotnych zapytań do API.
+        Tworzy prywatny katalog cache (0700). Katalog należący do innego
+        użytkownika (np. założony wcześniej we współdzielonym /tmp) jest
+        odrzucany i cache na dysku zostaje wyłączony.
         """
-        # Validate inputs
-        if not validate_ticker(ticker):
-            self.logger.error(f"Invalid ticker format: {ticker}")
-            return None, None, None, None
-            
-        if not validate_date_string(reference_date_str):
-            self.logger.error(f"Invalid date format: {reference_date_str}")
-            return None, None, None, None
+        try:
+            cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            st = cache_dir.stat()
+            if hasattr(os, "getuid"):
+                if st.st_uid != os.getuid():
+                    self.logger.warning(f"Disk cache disabled, {cache_dir} is owned by another user")
+                    return None
+                if st.st_mode & 0o077:
+                    cache_dir.chmod(0o700)
+        except OSError as e:
+            self.logger.warning(f"Disk cache disabled, cannot create {cache_dir}: {e}")
+            return None
+        return cache_dir
+
+    def _disk_cache_path(self, ticker: str, ref_date_str: str) -> Path:
+        """Zwraca ścieżkę pliku cache na dysku dla pary (ticker, data), nazwaną skrótem SHA-1 klucza."""
+        key = hashlib.sha1(f"{ticker}|{ref_date_str}".encode()).hexdigest()
+        return self.cache_dir / f"{key}.v{self.DISK_CACHE_VERSION}.npz"
+
+    def is_immutable(self, ref_date_str: str) -> bool:
+        """Sprawdza, czy okres analizy dla daty odniesienia zakończył się na tyle dawno, że dane już się nie zmienią."""
+        try:
+            window_end = datetime.strptime(ref_date_str, '%Y-%m-%d') - relativedelta(months=1)
+        except ValueError:
+            return False
+        return window_end < datetime.now() - self.IMMUTABLE_AFTER
+
+    def _load_from_disk(self, ticker: str, ref_date_str: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        Wczytuje wpis z cache na dysku. Zwraca parę (wpis, czy_aktualny); wpis
+        przeterminowany nadal niesie ETag/Last-Modified do zapytania warunkowego.
+        Wpisy dla okresów z przeszłości nigdy nie wygasają.
+        """
+        if self.cache_dir is None:
+            return None, False
+        import numpy as np
         
+        path = self._disk_cache_path(ticker, ref_date_str)
         try:
-            reference_date = datetime.strptime(reference_date_str, '%Y-%m-%d')
-        except ValueError as e:
-            self.logger.error(f"Failed to parse date {reference_date_str}: {e}")
-            return None, None, None, None
+            # Plain arrays plus JSON metadata, never pickles, so cache files cannot carry code
+            with np.load(path, allow_pickle=False) as npz:
+                dates, prices = npz["dates"], npz["prices"]
+                meta = orjson.loads(npz["meta"].tobytes())
+            entry = {
+                "result": (meta["return"], dates[0].item(), dates[-1].item(), HistoricalSeries(dates=dates, prices=prices)),
+                "etag": meta["etag"],
+                "last_modified": meta["last_modified"],
+                "immutable": meta["immutable"]
+            }
+            fresh = entry["immutable"] or time.time() - path.stat().st_mtime <= self.CACHE_TTL.total_seconds()
+        except FileNotFoundError:
+            return None, False
+        except Exception as e:
+            self.logger.warning(f"Failed to read disk cache for {ticker}: {e}")
+            return None, False
+        if fresh:
+            self.logger.debug("Disk cache hit for %s (%s)", ticker, ref_date_str)
+        return entry, fresh
+
+    def _save_to_disk(self, ticker: str, ref_date_str: str, result: Tuple[Optional[float], Optional[datetime.date], Optional[datetime.date], Optional[HistoricalSeries]]) -> None:
+        """Zapisuje wynik wraz z nagłówkami walidującymi do cache na dysku (zapis atomowy przez plik tymczasowy)."""
+        if self.cache_dir is None:
+            return
+        import numpy as np
+        
+        etag, last_modified = self._validators.get(ticker, (None, None))
+        meta = {
+            "return": result[0],
+            "etag": etag,
+            "last_modified": last_modified,
+            "immutable": self.is_immutable(ref_date_str)
+        }
+        historical_data = result[3]
+        path = self._disk_cache_path(ticker, ref_date_str)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                np.savez(
+                    f,
+                    dates=historical_data.dates,
+                    prices=historical_data.prices,
+                    meta=np.frombuffer(orjson.dumps(meta), dtype=np.uint8)
+                )
+            os.replace(tmp_path, path)
+            self._prune_disk_cache()
+        except Exception as e:
+            self.logger.warning(f"Failed to write disk cache for {ticker}: {e}")
+
+    def _prune_disk_cache(self) -> None:
+        """Usuwa najstarsze pliki cache (wg czasu modyfikacji) ponad limit DISK_CACHE_MAX_FILES."""
+        try:
+            with os.scandir(self.cache_dir) as it:
+                files = [(e.stat().st_mtime, e.path) for e in it if e.name.endswith(".npz") and e.is_file()]
+        except OSError as e:
+            self.logger.warning(f"Failed to list disk cache: {e}")
+            return
+        excess = len(files) - self.DISK_CACHE_MAX_FILES
+        if excess <= 0:
+            return
+        files.sort()
+        for _, file_path in files[:excess]:
+            try:
+                os.remove(file_path)
+            except OSError:
+                pass
+        self.logger.debug("Pruned %d disk cache files", excess)
+
+    def _get_session(self) -> "AsyncSession":
+        """Zwraca współdzieloną sesję HTTP, tworząc ją przy pierwszym użyciu."""
+        if self._session is None:
+            from curl_cffi.requests import AsyncSession
             
+            self._session = AsyncSession(impersonate="chrome110")
+        return self._session
+
+    async def close(self) -> None:
+        """Zamyka współdzieloną sesję HTTP."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _fetch_csv(self, ticker: str, session: "AsyncSession", stale_entry: Optional[Dict[str, Any]] = None) -> Optional[bytes]:
+        """
+        Pobiera surowy plik CSV z danymi dziennymi dla tickera bez blokowania pętli zdarzeń.
+        Dla przeterminowanego wpisu wysyła zapytanie warunkowe i zwraca None,
+        jeśli dane się nie zmieniły (304 Not Modified).
+        """
         url = f"https://stooq.pl/q/d/l/?s={ticker}&i=d"
-        self.logger.debug(f"Fetching data for {ticker} from {url}")
+        self.logger.debug("Fetching data for %s from %s", ticker, url)
+        
+        headers = {}
+        if stale_entry is not None:
+            if stale_entry.get("etag"):
+                headers["If-None-Match"] = stale_entry["etag"]
+            if stale_entry.get("last_modified"):
+                headers["If-Modified-Since"] = stale_entry["last_modified"]
+        
+        response = await session.get(url, headers=headers or None)
+        if response.status_code == 304 and stale_entry is not None:
+            self._validators[ticker] = (stale_entry.get("etag"), stale_entry.get("last_modified"))
+            return None
+        response.raise_for_status()
+        self._validators[ticker] = (response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        return response.content
+
+    def _calculate_12m_return(self, ticker: str, reference_date: datetime, csv_data: bytes) -> Tuple[Optional[float], Optional[datetime.date], Optional[datetime.date], Optional[HistoricalSeries]]:
+        """Liczy zwrot % za okres 1 roku na podstawie pobranego pliku CSV."""
+        import numpy as np
+        import pandas as pd
         
         try:
-            response = cffi_requests.get(url, impersonate="chrome110")
-            response.raise_for_status()
-            df = pd.read_csv(StringIO(response.text))
-        except RequestException as e:
-            self.logger.error(f"Network error while fetching {ticker} from Stooq: {e}")
-            return None, None, None, None
+            df = _read_stooq_csv(csv_data)
         except Exception as e:
             self.logger.error(f"Data processing error for {ticker} from Stooq: {e}")
             return None, None, None, None
 
-        if df.empty or ("Close" not in df.columns and "Zamkniecie" not in df.columns):
+        if df.empty or "Data" not in df.columns or ("Close" not in df.columns and "Zamkniecie" not in df.columns):
             self.logger.error(f"No data or invalid format for {ticker}")
             return None, None, None, None
         
         close_col = "Close" if "Close" in df.columns else "Zamkniecie"
         
         try:
-            df["Data"] = pd.to_datetime(df["Data"])
-            df = df.sort_values(by="Data")
+            df["Data"] = pd.to_datetime(df["Data"], format='%Y-%m-%d')
+            # Stooq returns chronological data, so sorting is only needed as a fallback
+            if not df["Data"].is_monotonic_increasing:
+                df = df.sort_values(by="Data")
         except Exception as e:
             self.logger.error(f"Error processing date column for {ticker}: {e}")
             return None, None, None, None
@@ -125,50 +337,209 @@ class StooqDataFetcher:
         end_date = reference_date - pd.DateOffset(months=1)
         start_date = end_date - pd.DateOffset(years=1) + pd.DateOffset(days=1)
         
-        self.logger.debug(f"Analyzing period {start_date.date()} - {end_date.date()} for {ticker}")
+        self.logger.debug("Analyzing period %s - %s for %s", start_date.date(), end_date.date(), ticker)
         
         df_12m = df[(df["Data"] >= start_date) & (df["Data"] <= end_date)]
 
         if df_12m.empty:
-            self.logger.warning(f"No data in period {start_date.date()} - {end_date.date()} for {ticker}")
+            self.logger.warning("No data in period %s - %s for %s", start_date.date(), end_date.date(), ticker)
             return None, None, None, None
         
-        first_price = safe_float_conversion(df_12m.iloc[0][close_col])
-        last_price = safe_float_conversion(df_12m.iloc[-1][close_col])
+        # Non-numeric price cells become NaN and are dropped together with their dates
+        prices = pd.to_numeric(df_12m[close_col], errors="coerce").to_numpy(dtype=np.float64)
+        dates = df_12m["Data"].to_numpy().astype('datetime64[D]')
+        valid = ~np.isnan(prices)
+        if not valid.all():
+            prices, dates = prices[valid], dates[valid]
+        if prices.size == 0:
+            self.logger.warning("No valid prices in period %s - %s for %s", start_date.date(), end_date.date(), ticker)
+            return None, None, None, None
+        first_price, last_price = float(prices[0]), float(prices[-1])
 
-        if first_price <= 0 or last_price <= 0:
-            self.logger.warning(f"Invalid prices for {ticker}: first={first_price}, last={last_price}")
+        if not (first_price > 0 and last_price > 0):
+            self.logger.warning("Invalid prices for %s: first=%s, last=%s", ticker, first_price, last_price)
             return None, None, None, None
 
         # Obliczenie zwrotu procentowego
         try:
-            return_percentage = safe_divide(last_price, first_price, 1.0) - 1
-            return_percentage *= 100
+            return_percentage = (last_price / first_price - 1) * 100
             
-            historical_data = df_12m[['Data', close_col]].rename(columns={'Data': 'date', close_col: 'price'})
+            # Arrays are passed through as-is and only converted to lists for the chart payload
+            historical_data = HistoricalSeries(dates=dates, prices=prices)
             
-            self.logger.info(f"Successfully calculated return for {ticker}: {return_percentage:.2f}%")
+            self.logger.info("Successfully calculated return for %s: %.2f%%", ticker, return_percentage)
             
-            return return_percentage, df_12m.iloc[0]["Data"].date(), df_12m.iloc[-1]["Data"].date(), historical_data.to_dict('records')
+            return return_percentage, dates[0].item(), dates[-1].item(), historical_data
         except Exception as e:
             self.logger.error(f"Error calculating return for {ticker}: {e}")
             return None, None, None, None
 
-    def get_return(self, ticker: str, ref_date_str: str) -> Tuple[Optional[float], Optional[datetime.date], Optional[datetime.date], Optional[List[Dict[str, Any]]]]:
-        """Sprawdza, czy cache nie wygasł i zwraca dane z cachowanej funkcji."""
+    async def _get_12m_return_stooq(self, ticker: str, reference_date_str: str, session: "AsyncSession", stale_entry: Optional[Dict[str, Any]] = None) -> Tuple[Optional[float], Optional[datetime.date], Optional[datetime.date], Optional[HistoricalSeries]]:
+        """
+        Pobiera dane dzienne z Stooq i liczy zwrot % za okres 1 roku.
+        """
+        # Validate inputs
+        if not validate_ticker(ticker):
+            self.logger.error(f"Invalid ticker format: {ticker}")
+            return None, None, None, None
+            
+        if not validate_date_string(reference_date_str):
+            self.logger.error(f"Invalid date format: {reference_date_str}")
+            return None, None, None, None
+        
+        try:
+            reference_date = datetime.strptime(reference_date_str, '%Y-%m-%d')
+        except ValueError as e:
+            self.logger.error(f"Failed to parse date {reference_date_str}: {e}")
+            return None, None, None, None
+        
+        try:
+            csv_data = await self._fetch_csv(ticker, session, stale_entry)
+        except RequestException as e:
+            self.logger.error(f"Network error while fetching {ticker} from Stooq: {e}")
+            return None, None, None, None
+        except Exception as e:
+            self.logger.error(f"Data processing error for {ticker} from Stooq: {e}")
+            return None, None, None, None
+
+        if csv_data is None:
+            self.logger.debug("Data for %s not modified, reusing cached result", ticker)
+            return stale_entry["result"]
+
+        # Parsing runs on the worker pool so the tickers of a batch are processed in parallel
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _get_parse_executor(), self._calculate_12m_return, ticker, reference_date, csv_data
+        )
+
+    def _get_cached(self, ticker: str, ref_date_str: str) -> Tuple[Optional[Tuple[Optional[float], Optional[datetime.date], Optional[datetime.date], Optional[HistoricalSeries]]], Optional[Dict[str, Any]]]:
+        """
+        Zwraca parę (wynik, przeterminowany_wpis): wynik z cache w pamięci lub na
+        dysku, o ile jest aktualny, albo przeterminowany wpis z dysku do odświeżenia.
+        """
         if datetime.now() - self.last_cache_reset > self.CACHE_TTL:
-            self._get_12m_return_stooq_cached.cache_clear()
+            self._cache.clear()
             self.last_cache_reset = datetime.now()
             self.logger.info("Cache has been reset")
-        return self._get_12m_return_stooq_cached(ticker, ref_date_str)
+        
+        key = (ticker, ref_date_str)
+        if key in self._cache:
+            return self._cache[key], None
+        
+        entry, fresh = self._load_from_disk(ticker, ref_date_str)
+        if entry is None:
+            return None, None
+        if not fresh:
+            return None, entry
+        self._store(ticker, ref_date_str, entry["result"], persist=False)
+        return entry["result"], None
+
+    def _store(self, ticker: str, ref_date_str: str, result: Tuple[Optional[float], Optional[datetime.date], Optional[datetime.date], Optional[HistoricalSeries]], persist: bool = True) -> None:
+        """Zapisuje wynik w cache w pamięci i, jeśli to sukces, na dysku (co odnawia też TTL wpisu)."""
+        # Only successful results are persisted, so transient failures are retried after a cold start
+        if persist and result[0] is not None:
+            self._save_to_disk(ticker, ref_date_str, result)
+        if len(self._cache) >= self.CACHE_MAXSIZE:
+            self._cache.pop(next(iter(self._cache)))
+        self._cache[(ticker, ref_date_str)] = result
+
+    async def get_returns_batch(self, tickers: List[str], ref_date_str: str) -> Dict[str, Tuple[Optional[float], Optional[datetime.date], Optional[datetime.date], Optional[HistoricalSeries]]]:
+        """
+        Zwraca dane dla wielu tickerów naraz. Brakujące w cache tickery są pobierane
+        równolegle przez współdzieloną sesję z pulą połączeń do stooq.pl.
+        """
+        results: Dict[str, Tuple[Optional[float], Optional[datetime.date], Optional[datetime.date], Optional[HistoricalSeries]]] = {}
+        missing: List[str] = []
+        stale_entries: Dict[str, Dict[str, Any]] = {}
+        for ticker in tickers:
+            cached, stale_entry = self._get_cached(ticker, ref_date_str)
+            if cached is not None:
+                results[ticker] = cached
+            else:
+                missing.append(ticker)
+                if stale_entry is not None:
+                    stale_entries[ticker] = stale_entry
+        
+        if missing:
+            session = self._get_session()
+            # Exceptions are returned per ticker so one bad ticker does not fail the whole batch
+            fetched = await asyncio.gather(
+                *(self._get_12m_return_stooq(ticker, ref_date_str, session, stale_entries.get(ticker)) for ticker in missing),
+                return_exceptions=True
+            )
+            for ticker, result in zip(missing, fetched):
+                if isinstance(result, BaseException):
+                    self.logger.error(f"Unexpected error fetching {ticker}: {result}")
+                    results[ticker] = (None, None, None, None)
+                    continue
+                self._store(ticker, ref_date_str, result)
+                results[ticker] = result
+        
+        return results
+
+    async def get_return(self, ticker: str, ref_date_str: str) -> Tuple[Optional[float], Optional[datetime.date], Optional[datetime.date], Optional[HistoricalSeries]]:
+        """
+        Sprawdza, czy cache nie wygasł i zwraca dane z cache lub pobiera je z Stooq.
+        Wyniki są cachowane w pamięci oraz na dysku, aby unikać wielokrotnych
+        zapytań do API również po zimnym starcie procesu.
+        """
+        results = await self.get_returns_batch([ticker], ref_date_str)
+        return results[ticker]
+
+# ETF categories as sets for O(1) membership checks, plus a name -> type lookup
+EQUITY_ETFS_SET: FrozenSet[str] = frozenset(settings.etf.equity_etfs)
+BOND_ETFS_SET: FrozenSet[str] = frozenset(settings.etf.bond_etfs)
+ETF_TYPE: Dict[str, str] = {
+    **{name: "equity" for name in settings.etf.equity_etfs},
+    **{name: "bond" for name in settings.etf.bond_etfs}
+}
 
 # Initialize services
-data_fetcher = StooqDataFetcher(cache_ttl_hours=settings.data.cache_ttl_hours)
-data_service = DataService(data_fetcher)
 strategy_service = StrategyService()
 
+@cache
+def get_data_service() -> DataService:
+    """Create the data service and its Stooq fetcher on first use."""
+    data_fetcher = StooqDataFetcher(
+        cache_ttl_hours=settings.data.cache_ttl_hours,
+        cache_dir=os.getenv("CACHE_DIR", "/tmp/stooq")
+    )
+    logger.info(f"Data fetcher cache TTL: {settings.data.cache_ttl_hours} hours")
+    return DataService(data_fetcher)
+
 logger.info("Services initialized successfully")
-logger.info(f"Data fetcher cache TTL: {settings.data.cache_ttl_hours} hours")
+
+@app.on_event("shutdown")
+async def close_data_fetcher() -> None:
+    """Close the shared Stooq HTTP session if the data service was created."""
+    if get_data_service.cache_info().currsize:
+        await get_data_service().data_fetcher.close()
+
+def cached_per_second(format_now: Callable[[int], str]) -> Callable[[], str]:
+    """
+    Wrap a formatter of epoch seconds so it runs at most once per second.
+    
+    The cache is a single (epoch second, string) tuple, replaced in one
+    assignment so concurrent callers never see a half-updated pair.
+    """
+    cached: Tuple[int, str] = (0, "")
+    
+    def now_str() -> str:
+        nonlocal cached
+        now = int(time.time())
+        if now != cached[0]:
+            cached = (now, format_now(now))
+        return cached[1]
+    
+    return now_str
+
+# Current UTC time as ISO 8601 with second granularity, e.g. 2024-01-02T03:04:05Z
+iso_now_1s = cached_per_second(lambda now: datetime.fromtimestamp(now, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'))
+# Today's local date as YYYY-MM-DD
+today_date_str = cached_per_second(lambda now: datetime.fromtimestamp(now).strftime('%Y-%m-%d'))
+
+# Chart payload rendered when there are no results
+_EMPTY_CHART = "[]"
 
 @app.get("/", response_class=HTMLResponse)
 async def form_get(request: Request):
@@ -179,8 +550,7 @@ async def form_get(request: Request):
         HTML template with date selection form
     """
     logger.debug("GET request to main form")
-    today_date = datetime.today().strftime('%Y-%m-%d')
-    return templates.TemplateResponse("index.html", {"request": request, "results": None, "choice": None, "benchmark": None, "today_date": today_date})
+    return templates.TemplateResponse("index.html", {"request": request, "results": None, "choice": None, "benchmark": None, "today_date": today_date_str()})
 
 @app.post("/", response_class=HTMLResponse)
 async def calculate(
@@ -196,7 +566,7 @@ async def calculate(
     Returns:
         HTML template with analysis results and recommendations
     """
-    logger.info(f"Processing calculation request for reference date: {reference_date_str}")
+    logger.info("Processing calculation request for reference date: %s", reference_date_str)
     
     try:
         # Validate input
@@ -204,18 +574,18 @@ async def calculate(
             logger.error(f"Invalid date format: {reference_date_str}")
             raise ValidationError("Invalid date format", field="reference_date", value=reference_date_str)
         
-        # Get data using services
-        results_data = data_service.get_all_etf_returns(reference_date_str)
-        benchmark_result = data_service.get_benchmark_data(reference_date_str)
-        choice = strategy_service.calculate_gem_strategy(results_data, settings.etf.equity_etfs, settings.etf.bond_etfs)
+        # Get data using services; ETFs and the benchmark are fetched in one batch
+        data_service = get_data_service()
+        results_data, benchmark_result = await data_service.get_all_etf_returns_bulk(reference_date_str)
+        choice = strategy_service.calculate_gem_strategy(results_data, EQUITY_ETFS_SET, BOND_ETFS_SET)
         
-        logger.info(f"Strategy calculation completed. Recommendation: {choice}")
+        logger.info("Strategy calculation completed. Recommendation: %s", choice)
 
         # Prepare template data using services
         results_for_template = data_service.prepare_template_data(results_data)
-        chart_data = data_service.prepare_chart_data(results_data, benchmark_result)
+        chart_json = data_service.prepare_chart_data_json(results_data, benchmark_result)
         
-        logger.info(f"Template data prepared: {len(results_for_template)} results, {len(chart_data)} chart datasets")
+        logger.info("Template data prepared: %d results, %d bytes of chart data", len(results_for_template), len(chart_json))
 
         return templates.TemplateResponse("index.html", {
             "request": request,
@@ -223,7 +593,7 @@ async def calculate(
             "choice": choice, 
             "benchmark": benchmark_result, 
             "today_date": reference_date_str,
-            "chart_data": json.dumps(chart_data, default=str)
+            "chart_data": chart_json.decode()
         })
         
     except ValidationError as e:
@@ -234,7 +604,7 @@ async def calculate(
             "choice": f"Błąd: {e.message}", 
             "benchmark": None, 
             "today_date": reference_date_str,
-            "chart_data": "[]"
+            "chart_data": _EMPTY_CHART
         })
         
     except Exception as e:
@@ -245,9 +615,16 @@ async def calculate(
             "choice": "Wystąpił nieoczekiwany błąd. Spróbuj ponownie później.", 
             "benchmark": None, 
             "today_date": reference_date_str,
-            "chart_data": "[]"
+            "chart_data": _EMPTY_CHART
         })
 
+# Static part of the health payload; only the timestamp changes per call
+_HEALTH_STATIC: Dict[str, Any] = {
+    "status": "healthy",
+    "version": settings.api.version,
+    "environment": settings.environment
+}
+
 # New API endpoints for better functionality
 @app.get("/api/health", tags=["health"])
 async def health_check():
@@ -257,76 +634,38 @@ async def health_check():
     Returns:
         Health status information
     """
-    return {
-        "status": "healthy",
-        "version": settings.api.version,
-        "environment": settings.environment,
-        "timestamp": datetime.now().isoformat()
-    }
+    return ORJSONResponse({**_HEALTH_STATIC, "timestamp": iso_now_1s()})
 
-@app.get("/api/etfs", tags=["data"])
-async def get_etf_list():
-    """
-    Get list of available ETFs.
-    
-    Returns:
-        List of ETF information
-    """
-    etf_list = []
-    for name, ticker in settings.etf.tickers.items():
-        etf_type = "equity" if name in settings.etf.equity_etfs else "bond"
-        etf_list.append({
+# Static API payloads, built once since they depend only on settings
+_ETF_LIST_RESPONSE: Dict[str, Any] = {
+    "etfs": [
+        {
             "name": name,
             "ticker": ticker,
-            "type": etf_type
-        })
-    
-    return {
-        "etfs": etf_list,
-        "total": len(etf_list),
-        "equity_count": len(settings.etf.equity_etfs),
-        "bond_count": len(settings.etf.bond_etfs)
-    }
-
-@app.get("/api/strategy/parameters", tags=["strategy"])
-async def get_strategy_parameters():
-    """
-    Get current GEM strategy parameters.
-    
-    Returns:
-        Strategy parameters and configuration
-    """
-    return {
-        "strategy_name": "Global Equities Momentum (GEM)",
-        "description": "Momentum-based strategy that invests in the best performing equity ETF or moves to bonds if all equities are negative",
-        "parameters": {
-            "lookback_period": "12 months",
-            "rebalance_frequency": "monthly",
-            "equity_etfs": settings.etf.equity_etfs,
-            "bond_etfs": settings.etf.bond_etfs,
-            "benchmark": settings.etf.benchmark_ticker
-        },
-        "cache_settings": {
-            "ttl_hours": settings.data.cache_ttl_hours,
-            "max_retries": settings.data.max_retries
+            "type": ETF_TYPE.get(name, "bond")
         }
-    }
+        for name, ticker in settings.etf.tickers.items()
+    ],
+    "total": len(settings.etf.tickers),
+    "equity_count": len(settings.etf.equity_etfs),
+    "bond_count": len(settings.etf.bond_etfs)
+}
 
-# New API endpoints for better functionality
-@app.get("/api/health", tags=["health"])
-async def health_check():
-    """
-    Health check endpoint for monitoring.
-    
-    Returns:
-        Health status information
-    """
-    return {
-        "status": "healthy",
-        "version": settings.api.version,
-        "environment": settings.environment,
-        "timestamp": datetime.now().isoformat()
+_STRATEGY_PARAMS_RESPONSE: Dict[str, Any] = {
+    "strategy_name": "Global Equities Momentum (GEM)",
+    "description": "Momentum-based strategy that invests in the best performing equity ETF or moves to bonds if all equities are negative",
+    "parameters": {
+        "lookback_period": "12 months",
+        "rebalance_frequency": "monthly",
+        "equity_etfs": settings.etf.equity_etfs,
+        "bond_etfs": settings.etf.bond_etfs,
+        "benchmark": settings.etf.benchmark_ticker
+    },
+    "cache_settings": {
+        "ttl_hours": settings.data.cache_ttl_hours,
+        "max_retries": settings.data.max_retries
     }
+}
 
 @app.get("/api/etfs", tags=["data"])
 async def get_etf_list():
@@ -336,21 +675,7 @@ async def get_etf_list():
     Returns:
         List of ETF information
     """
-    etf_list = []
-    for name, ticker in TICKERS.items():
-        etf_type = "equity" if name in EQUITY_ETFS else "bond"
-        etf_list.append({
-            "name": name,
-            "ticker": ticker,
-            "type": etf_type
-        })
-    
-    return {
-        "etfs": etf_list,
-        "total": len(etf_list),
-        "equity_count": len(EQUITY_ETFS),
-        "bond_count": len(BOND_ETFS)
-    }
+    return _ETF_LIST_RESPONSE
 
 @app.get("/api/strategy/parameters", tags=["strategy"])
 async def get_strategy_parameters():
@@ -360,18 +685,4 @@ async def get_strategy_parameters():
     Returns:
         Strategy parameters and configuration
     """
-    return {
-        "strategy_name": "Global Equities Momentum (GEM)",
-        "description": "Momentum-based strategy that invests in the best performing equity ETF or moves to bonds if all equities are negative",
-        "parameters": {
-            "lookback_period": "12 months",
-            "rebalance_frequency": "monthly",
-            "equity_etfs": EQUITY_ETFS,
-            "bond_etfs": BOND_ETFS,
-            "benchmark": BENCHMARK_TICKER
-        },
-        "cache_settings": {
-            "ttl_hours": settings.data.cache_ttl_hours,
-            "max_retries": settings.data.max_retries
-        }
-    }
+    return _STRATEGY_PARAMS_RESPONSE
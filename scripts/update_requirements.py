@@ -3,60 +3,121 @@
 Script to update and manage Python dependencies for GemStrategy.
 """
 
+import json
+import shlex
 import subprocess
 import sys
 import os
+from importlib import metadata
 from pathlib import Path
+from typing import List
 
+# pip of the interpreter running this script
+PIP = [sys.executable, "-m", "pip"]
 
-def run_command(command: str, check: bool = True) -> subprocess.CompletedProcess:
-    """Run a shell command and return the result."""
+
+def run_command(argv: List[str], check: bool = True, stream: bool = False) -> subprocess.CompletedProcess:
+    """
+    Run a command (without a shell) and return the result.
+    
+    With stream=True the combined stdout/stderr is echoed line by line as the
+    command runs instead of being buffered, and is not kept on the result.
+    """
+    command = shlex.join(argv)
     print(f"Running: {command}")
-    result = subprocess.run(command, shell=True, capture_output=True, text=True)
+    try:
+        if stream:
+            result = _run_streaming(argv)
+        else:
+            result = subprocess.run(argv, capture_output=True, text=True)
+    except FileNotFoundError as e:
+        result = subprocess.CompletedProcess(argv, 127, stdout="", stderr=str(e))
     
     if check and result.returncode != 0:
         print(f"Error running command: {command}")
-        print(f"STDOUT: {result.stdout}")
-        print(f"STDERR: {result.stderr}")
+        if not stream:
+            print(f"STDOUT: {result.stdout}")
+            print(f"STDERR: {result.stderr}")
         sys.exit(1)
     
     return result
 
 
+def _run_streaming(argv: List[str]) -> subprocess.CompletedProcess:
+    """Run a command, echoing its output as it arrives."""
+    with subprocess.Popen(argv, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                          text=True, bufsize=1) as proc:
+        for line in proc.stdout:
+            print(line, end='')
+        returncode = proc.wait()
+    return subprocess.CompletedProcess(argv, returncode, stdout=None, stderr=None)
+
+
 def update_pip():
     """Update pip to the latest version."""
     print("Updating pip...")
-    run_command("python -m pip install --upgrade pip")
+    run_command([*PIP, "install", "--upgrade", "pip"], stream=True)
 
 
 def install_requirements():
     """Install requirements from requirements.txt."""
     print("Installing requirements...")
-    run_command("pip install -r requirements.txt")
+    # Prefer cached/prebuilt wheels over building sdists
+    run_command(
+        [*PIP, "install", "--prefer-binary", "--disable-pip-version-check", "-r", "requirements.txt"],
+        stream=True
+    )
+
+
+def is_direct_url_install(name: str) -> bool:
+    """Whether a distribution was installed from a URL or local path rather than an index."""
+    try:
+        return metadata.distribution(name).read_text("direct_url.json") is not None
+    except metadata.PackageNotFoundError:
+        return False
 
 
 def update_requirements():
     """Update all packages to their latest versions."""
     print("Updating all packages to latest versions...")
     
-    # Get list of installed packages
-    result = run_command("pip list --format=freeze")
-    packages = [line.split('==')[0] for line in result.stdout.strip().split('\n') if '==' in line]
+    # Get list of installed packages; editable checkouts and direct-URL installs are not
+    # on PyPI under their name, so upgrading them by name would fail or replace them
+    result = run_command([*PIP, "list", "--format=json", "--exclude-editable"])
+    packages = [
+        package["name"] for package in json.loads(result.stdout)
+        if "editable_project_location" not in package and not is_direct_url_install(package["name"])
+    ]
+    
+    packages = [package for package in packages if package not in ['pip', 'setuptools', 'wheel']]
+    if not packages:
+        print("No packages to update.")
+        return
+    
+    # Upgrade everything in one pip run so the resolver and downloads are shared
+    result = run_command([*PIP, "install", "--upgrade", *packages], check=False, stream=True)
+    if result.returncode == 0:
+        return
     
-    # Update each package
+    # A single bad package fails the whole batch, so fall back to updating each one separately.
+    # These runs stay sequential: pip does no locking, and concurrent installs into the same
+    # site-packages can leave shared dependencies half-installed.
+    print("Batch update failed, retrying packages one by one...")
     for package in packages:
-        if package not in ['pip', 'setuptools', 'wheel']:
-            print(f"Updating {package}...")
-            try:
-                run_command(f"pip install --upgrade {package}", check=False)
-            except Exception as e:
-                print(f"Failed to update {package}: {e}")
+        print(f"Updating {package}...")
+        try:
+            result = run_command([*PIP, "install", "--upgrade", package], check=False, stream=True)
+            if result.returncode != 0:
+                print(f"Failed to update {package} (exit code {result.returncode})")
+        except Exception as e:
+            print(f"Failed to update {package}: {e}")
 
 
 def generate_requirements():
     """Generate a new requirements.txt with current versions."""
     print("Generating new requirements.txt...")
-    run_command("pip freeze > requirements.txt")
+    result = run_command([*PIP, "freeze"])
+    Path("requirements.txt").write_text(result.stdout)
     print("New requirements.txt generated!")
 
 
@@ -64,8 +125,8 @@ def check_security():
     """Check for security vulnerabilities in dependencies."""
     print("Checking for security vulnerabilities...")
     try:
-        run_command("pip install safety", check=False)
-        run_command("safety check", check=False)
+        run_command([*PIP, "install", "safety"], check=False, stream=True)
+        run_command(["safety", "check"], check=False, stream=True)
     except Exception as e:
         print(f"Security check failed: {e}")
 
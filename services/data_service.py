@@ -2,16 +2,36 @@
 Data service for managing data fetching and processing operations.
 """
 
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
+from collections import OrderedDict
 from datetime import datetime, timedelta
-import pandas as pd
-from io import StringIO
 import logging
+import orjson
 from error_handling import DataFetchError, DataProcessingError
 from config_package.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of settled (ticker, reference date) results memoized by DataService
+RETURNS_CACHE_MAXSIZE = 512
+
+
+class HistoricalSeries(NamedTuple):
+    """Price history as parallel NumPy arrays (datetime64[D] dates, float64 prices)."""
+    dates: Any
+    prices: Any
+    
+    def to_chart_arrays(self) -> Dict[str, Any]:
+        """Return the series for orjson: ISO date strings and the raw price array."""
+        return {"dates": self.dates.astype(str), "prices": self.prices}
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Fallback for values orjson cannot serialize natively, such as string or non-contiguous arrays."""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
 
 class DataService:
     """Service for managing data operations."""
@@ -20,24 +40,109 @@ class DataService:
         self.data_fetcher = data_fetcher
         self.logger = logger
         self.settings = get_settings()
+        # The ETF universe is fixed for the process lifetime; freeze it once.
+        self._ticker_items: Tuple[Tuple[str, str], ...] = tuple(self.settings.etf.tickers.items())
+        self._etf_tickers: Tuple[str, ...] = tuple(ticker for _, ticker in self._ticker_items)
+        self._returns_cache: "OrderedDict[Tuple[str, str], Tuple[Any, ...]]" = OrderedDict()
     
-    def get_all_etf_returns(self, ref_date_str: str) -> Dict[str, Dict[str, Any]]:
+    async def _get_returns(self, tickers: List[str], ref_date_str: str) -> Dict[str, Tuple[Any, ...]]:
+        """
+        Get fetcher results for the tickers, memoized on (ticker, ref_date_str).
+        
+        Only periods the fetcher treats as immutable are memoized; recent ones
+        always go through the fetcher so its TTL and revalidation apply. Failed
+        lookups are not memoized so that they are retried on the next request.
+        
+        Args:
+            tickers: Tickers to resolve
+            ref_date_str: Reference date string in YYYY-MM-DD format
+            
+        Returns:
+            Dictionary mapping ticker to the fetcher result tuple
+        """
+        results = {}
+        missing = []
+        for ticker in tickers:
+            key = (ticker, ref_date_str)
+            if key in self._returns_cache:
+                self._returns_cache.move_to_end(key)
+                results[ticker] = self._returns_cache[key]
+            else:
+                missing.append(ticker)
+        
+        if missing:
+            fetched = await self.data_fetcher.get_returns_batch(missing, ref_date_str)
+            memoize = self.data_fetcher.is_immutable(ref_date_str)
+            for ticker, result in fetched.items():
+                results[ticker] = result
+                if memoize and result[0] is not None:
+                    self._returns_cache[(ticker, ref_date_str)] = result
+                    if len(self._returns_cache) > RETURNS_CACHE_MAXSIZE:
+                        self._returns_cache.popitem(last=False)
+        
+        return results
+    
+    async def get_all_etf_returns(self, ref_date_str: str) -> Dict[str, Dict[str, Any]]:
         """
         Get returns and historical data for all defined ETFs.
         
+        All tickers are resolved in a single concurrent batch.
+        
         Args:
             ref_date_str: Reference date string in YYYY-MM-DD format
             
         Returns:
             Dictionary containing ETF data
         """
-        self.logger.info(f"Fetching returns for all ETFs with reference date: {ref_date_str}")
+        self.logger.info("Fetching returns for all ETFs with reference date: %s", ref_date_str)
+        outcomes = await self._get_returns_safe(list(self._etf_tickers), ref_date_str)
+        return self._build_etf_results(outcomes)
+    
+    async def get_benchmark_data(self, ref_date_str: str) -> Dict[str, Any]:
+        """
+        Get benchmark return and historical data.
+        
+        Args:
+            ref_date_str: Reference date string in YYYY-MM-DD format
+            
+        Returns:
+            Dictionary containing benchmark data
+        """
+        self.logger.info("Fetching benchmark return for %s with reference date: %s", self.settings.etf.benchmark_ticker, ref_date_str)
+        outcomes = await self._get_returns_safe([self.settings.etf.benchmark_ticker], ref_date_str)
+        return self._build_benchmark_data(outcomes)
+    
+    async def get_all_etf_returns_bulk(self, ref_date_str: str) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Any]]:
+        """
+        Get ETF and benchmark data with a single batched fetcher call.
+        
+        Args:
+            ref_date_str: Reference date string in YYYY-MM-DD format
+            
+        Returns:
+            Tuple of (ETF data as returned by get_all_etf_returns, benchmark data)
+        """
+        self.logger.info("Fetching returns for all ETFs and benchmark with reference date: %s", ref_date_str)
+        tickers = [*self._etf_tickers, self.settings.etf.benchmark_ticker]
+        outcomes = await self._get_returns_safe(tickers, ref_date_str)
+        return self._build_etf_results(outcomes), self._build_benchmark_data(outcomes)
+    
+    async def _get_returns_safe(self, tickers: List[str], ref_date_str: str) -> Dict[str, Tuple[Any, ...]]:
+        """Fetch a batch of tickers, logging failures and returning an empty result instead of raising."""
+        try:
+            return await self._get_returns(tickers, ref_date_str)
+        except Exception as e:
+            self.logger.error(f"Error fetching batch {tickers}: {e}")
+            return {}
+    
+    def _build_etf_results(self, outcomes: Dict[str, Tuple[Any, ...]]) -> Dict[str, Dict[str, Any]]:
+        """Assemble per-ETF result dictionaries from fetcher outcomes."""
         results = {}
         
-        for name, ticker in self.settings.etf.tickers.items():
-            self.logger.debug(f"Processing ETF: {name} ({ticker})")
+        for name, ticker in self._ticker_items:
+            self.logger.debug("Processing ETF: %s (%s)", name, ticker)
             try:
-                ret, start_date, end_date, historical_data = self.data_fetcher.get_return(ticker, ref_date_str)
+                ret, start_date, end_date, historical_data = outcomes[ticker]
                 results[name] = {
                     "ticker": name,
                     "return": ret,
@@ -45,7 +150,7 @@ class DataService:
                     "end": end_date,
                     "historical_data": historical_data
                 }
-                self.logger.debug(f"Successfully processed {name}: return={ret}, period={start_date} to {end_date}")
+                self.logger.debug("Successfully processed %s: return=%s, period=%s to %s", name, ret, start_date, end_date)
             except Exception as e:
                 self.logger.error(f"Error processing ETF {name}: {e}")
                 results[name] = {
@@ -56,27 +161,17 @@ class DataService:
                     "historical_data": None
                 }
         
-        self.logger.info(f"Completed fetching returns for {len(results)} ETFs")
+        self.logger.info("Completed fetching returns for %d ETFs", len(results))
         return results
     
-    def get_benchmark_data(self, ref_date_str: str) -> Dict[str, Any]:
-        """
-        Get benchmark return and historical data.
-        
-        Args:
-            ref_date_str: Reference date string in YYYY-MM-DD format
-            
-        Returns:
-            Dictionary containing benchmark data
-        """
-        self.logger.info(f"Fetching benchmark return for {self.settings.etf.benchmark_ticker} with reference date: {ref_date_str}")
-        
+    def _build_benchmark_data(self, outcomes: Dict[str, Tuple[Any, ...]]) -> Dict[str, Any]:
+        """Assemble the benchmark result dictionary from fetcher outcomes."""
         try:
-            bench_ret, bench_start, bench_end, historical_data = self.data_fetcher.get_return(self.settings.etf.benchmark_ticker, ref_date_str)
+            bench_ret, bench_start, bench_end, historical_data = outcomes[self.settings.etf.benchmark_ticker]
             
             if bench_ret is not None:
                 bench_ret_rounded = round(bench_ret, 2)
-                self.logger.debug(f"Benchmark return: {bench_ret_rounded}% for period {bench_start} to {bench_end}")
+                self.logger.debug("Benchmark return: %s%% for period %s to %s", bench_ret_rounded, bench_start, bench_end)
             else:
                 bench_ret_rounded = None
                 self.logger.warning("Benchmark return is None")
@@ -98,37 +193,38 @@ class DataService:
                 "historical_data": None
             }
     
-    def prepare_chart_data(self, results_data: Dict[str, Dict[str, Any]], 
-                          benchmark_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def prepare_chart_data_json(self, results_data: Dict[str, Dict[str, Any]], 
+                                benchmark_data: Dict[str, Any]) -> bytes:
         """
-        Prepare data for chart visualization.
+        Prepare chart datasets serialized to JSON bytes.
+        
+        orjson reads the NumPy price arrays directly, so no per-point Python
+        lists are built for prices. Dates are emitted as plain YYYY-MM-DD strings.
         
         Args:
             results_data: ETF performance data
             benchmark_data: Benchmark performance data
             
         Returns:
-            List of chart datasets
+            JSON-encoded list of chart datasets
         """
-        chart_data = []
-        
-        # Add ETF data
-        for name, data in results_data.items():
-            if data.get("historical_data"):
-                chart_data.append({
-                    "name": name,
-                    "data": data["historical_data"]
-                })
-        
-        # Add benchmark data
-        if benchmark_data.get("historical_data"):
+        chart_data = [
+            {"name": name, "data": data["historical_data"].to_chart_arrays()}
+            for name, data in results_data.items()
+            if self.is_complete(data)
+        ]
+        if self.is_complete(benchmark_data):
             chart_data.append({
                 "name": benchmark_data["name"],
-                "data": benchmark_data["historical_data"]
+                "data": benchmark_data["historical_data"].to_chart_arrays()
             })
         
-        self.logger.debug(f"Prepared chart data with {len(chart_data)} datasets")
-        return chart_data
+        self.logger.debug("Prepared chart data with %d datasets", len(chart_data))
+        return orjson.dumps(
+            chart_data,
+            default=_orjson_default,
+            option=orjson.OPT_SERIALIZE_NUMPY
+        )
     
     def prepare_template_data(self, results_data: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -140,32 +236,62 @@ class DataService:
         Returns:
             List of template-ready data
         """
-        template_data = []
-        
-        for name, data in results_data.items():
-            try:
-                return_value = round(data["return"], 2) if data["return"] is not None else None
-                template_data.append({
-                    "ticker": name,
-                    "return": return_value,
-                    "start": data["start"],
-                    "end": data["end"]
-                })
-                
-                self.logger.debug(f"Processed {name}: return={return_value}")
-                
-            except Exception as e:
-                self.logger.error(f"Error processing template data for {name}: {e}")
-                template_data.append({
-                    "ticker": name,
-                    "return": None,
-                    "start": None,
-                    "end": None
-                })
+        try:
+            template_data = [self._template_item(name, data) for name, data in results_data.items()]
+        except Exception as e:
+            # Malformed entries are rare, so they are handled per item only on this slow path
+            self.logger.error(f"Error processing template data: {e}")
+            template_data = [self._template_item_or_empty(name, data) for name, data in results_data.items()]
         
-        self.logger.info(f"Template data prepared: {len(template_data)} results")
+        self.logger.info("Template data prepared: %d results", len(template_data))
         return template_data
     
+    @staticmethod
+    def _template_item(name: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build one template entry; raises if the data is malformed."""
+        return {
+            "ticker": name,
+            "return": None if data["return"] is None else round(data["return"], 2),
+            "start": data["start"],
+            "end": data["end"]
+        }
+    
+    def _template_item_or_empty(self, name: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build one template entry, falling back to empty values if the data is malformed."""
+        try:
+            return self._template_item(name, data)
+        except Exception as e:
+            self.logger.error(f"Error processing template data for {name}: {e}")
+            return {
+                "ticker": name,
+                "return": None,
+                "start": None,
+                "end": None
+            }
+    
+    @staticmethod
+    def is_complete(data: Dict[str, Any]) -> bool:
+        """
+        Check whether data has a return, a date range and a non-empty price history.
+        
+        Stops at the first missing piece; use validate_data_quality when the
+        individual checks need to be reported.
+        
+        Args:
+            data: Data to check
+            
+        Returns:
+            True if the data is complete, False otherwise
+        """
+        historical_data = data.get('historical_data')
+        return (
+            data.get('return') is not None and
+            data.get('start') is not None and
+            data.get('end') is not None and
+            historical_data is not None and
+            historical_data.prices.size > 0
+        )
+    
     def validate_data_quality(self, data: Dict[str, Any]) -> Dict[str, bool]:
         """
         Validate data quality and completeness.
@@ -194,9 +320,10 @@ class DataService:
             )
             
             # Check if historical data exists
+            historical_data = data.get('historical_data')
             validation_results['has_historical_data'] = (
-                data.get('historical_data') is not None and 
-                len(data.get('historical_data', [])) > 0
+                historical_data is not None and 
+                historical_data.prices.size > 0
             )
             
             # Overall completeness
@@ -2,7 +2,7 @@
 Strategy service for implementing and managing investment strategies.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, FrozenSet, List, Any, Optional, Union
 from datetime import datetime
 import logging
 from error_handling import StrategyCalculationError
@@ -17,14 +17,15 @@ class StrategyService:
         self.logger = logger
     
     def calculate_gem_strategy(self, results_data: Dict[str, Dict[str, Any]], 
-                             equity_etfs: List[str], bond_etfs: List[str]) -> str:
+                             equity_etfs: Union[FrozenSet[str], List[str]],
+                             bond_etfs: Union[FrozenSet[str], List[str]]) -> str:
         """
         Calculate GEM strategy recommendation based on ETF performance data.
         
         Args:
             results_data: Dictionary containing ETF performance data
-            equity_etfs: List of equity ETF names
-            bond_etfs: List of bond ETF names
+            equity_etfs: Equity ETF names, ideally a frozenset built once at import
+            bond_etfs: Bond ETF names, ideally a frozenset built once at import
             
         Returns:
             Strategy recommendation string
@@ -34,43 +35,43 @@ class StrategyService:
         """
         try:
             self.logger.info("Calculating GEM strategy recommendation")
-            
-            # Filter equity ETFs with valid return data
-            equity_returns = {
-                k: v["return"] for k, v in results_data.items() 
-                if k in equity_etfs and v["return"] is not None
-            }
-            
-            if not equity_returns:
+            # Lists are still accepted, but callers should pass sets so nothing is rebuilt per call
+            equity_set = equity_etfs if isinstance(equity_etfs, (set, frozenset)) else frozenset(equity_etfs)
+            bond_set = bond_etfs if isinstance(bond_etfs, (set, frozenset)) else frozenset(bond_etfs)
+            
+            # Find best performing equity and bond ETFs with valid return data in one pass
+            best_equity_name = None
+            best_equity_return = float("-inf")
+            best_bond_name = None
+            best_bond_return = float("-inf")
+            for k, v in results_data.items():
+                ret = v["return"]
+                if ret is None:
+                    continue
+                if k in equity_set:
+                    if ret > best_equity_return:
+                        best_equity_name, best_equity_return = k, ret
+                elif k in bond_set and ret > best_bond_return:
+                    best_bond_name, best_bond_return = k, ret
+            
+            if best_equity_name is None:
                 self.logger.warning("No equity ETF data available for decision making")
                 return "Brak danych do podjęcia decyzji."
-
-            # Find best performing equity ETF
-            best_equity_name = max(equity_returns, key=equity_returns.get)
-            best_equity_return = equity_returns[best_equity_name]
             
-            self.logger.debug(f"Best equity ETF: {best_equity_name} with return: {best_equity_return}%")
+            self.logger.debug("Best equity ETF: %s with return: %s%%", best_equity_name, best_equity_return)
             
             # If best equity ETF has positive return, invest in it
             if best_equity_return > 0:
                 recommendation = f"Zainwestuj w {best_equity_name}"
-                self.logger.info(f"GEM recommendation: {recommendation} (positive equity return: {best_equity_return}%)")
+                self.logger.info("GEM recommendation: %s (positive equity return: %s%%)", recommendation, best_equity_return)
                 return recommendation
             
             # Otherwise, move to safe haven (bonds)
-            bond_returns = {
-                k: v["return"] for k, v in results_data.items() 
-                if k in bond_etfs and v["return"] is not None
-            }
-            
-            if bond_returns:
-                best_bond_name = max(bond_returns, key=bond_returns.get)
-                best_bond_return = bond_returns[best_bond_name]
+            if best_bond_name is not None:
                 recommendation = f"Zainwestuj w {best_bond_name} (ochrona kapitału)"
                 self.logger.info(
-                    f"GEM recommendation: {recommendation} "
-                    f"(negative equity return: {best_equity_return}%, "
-                    f"best bond: {best_bond_name} with return: {best_bond_return}%)"
+                    "GEM recommendation: %s (negative equity return: %s%%, best bond: %s with return: %s%%)",
+                    recommendation, best_equity_return, best_bond_name, best_bond_return
                 )
                 return recommendation
             else:
@@ -83,51 +84,6 @@ class StrategyService:
             self.logger.error(error_msg, exc_info=True)
             raise StrategyCalculationError(error_msg, strategy="GEM")
     
-    def calculate_performance_metrics(self, historical_data: List[Dict[str, Any]]) -> Dict[str, float]:
-        """
-        Calculate performance metrics from historical data.
-        
-        Args:
-            historical_data: List of historical price data
-            
-        Returns:
-            Dictionary containing performance metrics
-        """
-        try:
-            if not historical_data or len(historical_data) < 2:
-                return {}
-            
-            prices = [float(point['price']) for point in historical_data if point.get('price')]
-            if len(prices) < 2:
-                return {}
-            
-            # Calculate basic metrics
-            initial_price = prices[0]
-            final_price = prices[-1]
-            total_return = (final_price / initial_price - 1) * 100
-            
-            # Calculate volatility (standard deviation of returns)
-            returns = []
-            for i in range(1, len(prices)):
-                if prices[i-1] > 0:
-                    daily_return = (prices[i] / prices[i-1] - 1) * 100
-                    returns.append(daily_return)
-            
-            volatility = 0.0
-            if returns:
-                import statistics
-                volatility = statistics.stdev(returns) if len(returns) > 1 else 0.0
-            
-            return {
-                'total_return': round(total_return, 2),
-                'volatility': round(volatility, 2),
-                'data_points': len(prices)
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Error calculating performance metrics: {e}")
-            return {}
-    
     def validate_strategy_parameters(self, parameters: Dict[str, Any]) -> bool:
         """
         Validate strategy parameters.